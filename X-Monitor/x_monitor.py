@@ -11,19 +11,17 @@ Usage:
     python3 x_monitor.py --remove @username # Remove an account from monitoring
     python3 x_monitor.py --list             # List all monitored accounts
     python3 x_monitor.py --check @username  # Check a specific account only
+    python3 x_monitor.py --force            # Check all accounts, ignoring the check interval
 """
 
+# Only modules needed by every command are imported here. The network, XML
+# and notification machinery (asyncio, aiohttp, urllib, lxml/defusedxml/ElementTree,
+# orjson, sqlite3, subprocess, hashlib) is imported inside the functions that use it, so
+# account management commands start quickly from Alfred.
 import argparse
-import hashlib
 import json
 import os
-import subprocess
-import sys
 import time
-import urllib.request
-import urllib.error
-import xml.etree.ElementTree as ET
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from html import unescape
@@ -33,6 +31,27 @@ import re
 SCRIPT_DIR = Path(__file__).parent.resolve()
 CONFIG_FILE = SCRIPT_DIR / "config.json"
 STATE_FILE = SCRIPT_DIR / "seen_tweets.json"
+SEEN_DB_FILE = SCRIPT_DIR / "seen_tweets.db"
+
+# Number of most recent tweet IDs remembered per account
+SEEN_TWEETS_LIMIT = 100
+
+# Hash used by get_tweet_id; recorded in the state file so IDs from older
+# versions (truncated MD5) can be migrated
+TWEET_ID_SCHEME = "blake2b-64"
+
+# Namespace-qualified Atom tags, built once instead of per lookup
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ATOM_FEED_TAG = ATOM_NS + "feed"
+ATOM_ENTRY_TAG = ATOM_NS + "entry"
+ATOM_TITLE_TAG = ATOM_NS + "title"
+ATOM_LINK_TAG = ATOM_NS + "link"
+ATOM_PUBLISHED_TAG = ATOM_NS + "published"
+ATOM_CONTENT_TAG = ATOM_NS + "content"
+
+# Patterns used by clean_html, compiled once at import
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
 
 # Nitter instances to try (in order of preference)
 # These are public Nitter instances that provide RSS feeds
@@ -44,11 +63,36 @@ NITTER_INSTANCES = [
     "https://lightbrd.com",
 ]
 
+# Headers sent with every feed request (shared by the aiohttp session)
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "application/rss+xml, application/xml, text/xml, */*"
+}
+
+# Nitter RSS feed URL format: https://instance/{username}/rss
+FEED_URL_TEMPLATE = "{instance}/{username}/rss"
+
+# Failing instances are skipped for INSTANCE_BACKOFF_BASE seconds, doubling
+# with each consecutive failure up to INSTANCE_BACKOFF_MAX
+INSTANCE_BACKOFF_BASE = 60
+INSTANCE_BACKOFF_MAX = 600
+
+# Upper bound on worker threads for urllib fetches and feed parsing
+MAX_WORKER_THREADS = 8
+
+# Accounts whose last check started less than check_interval_minutes minus
+# this many seconds ago are skipped; the margin absorbs launchd jitter
+CHECK_INTERVAL_MARGIN = 60
+
+# Returned by fetch_rss_feed when the feed is unchanged since the last fetch
+NOT_MODIFIED = object()
+
 # Default configuration
 DEFAULT_CONFIG = {
     "accounts": [],
     "check_interval_minutes": 5,
     "max_notifications_per_check": 5,
+    "max_concurrency": 5,
     "nitter_instance": "https://nitter.poast.org",
     "notification_sound": "default"
 }
@@ -63,28 +107,168 @@ def load_config() -> dict:
             for key, value in DEFAULT_CONFIG.items():
                 if key not in config:
                     config[key] = value
-            return config
-    return DEFAULT_CONFIG.copy()
+    else:
+        config = DEFAULT_CONFIG.copy()
+    
+    # Store accounts normalized and deduplicated, keeping their order
+    config["accounts"] = list(dict.fromkeys(
+        normalize_username(account) for account in config.get("accounts", [])
+    ))
+    return config
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temporary file and move it over path in one step.
+    
+    The temporary file gets a unique name in the same directory, so
+    overlapping runs (launchd plus a manual check) never share it.
+    """
+    import tempfile
+    
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the target's permissions
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def save_config(config: dict) -> None:
     """Save configuration to file."""
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    write_file_atomic(CONFIG_FILE, json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+def load_orjson():
+    """Import orjson, or return None when it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        # Callers fall back to the stdlib json module
+        return None
+    return orjson
+
+
+_seen_db = None
+
+
+def get_seen_db():
+    """Open the SQLite database of seen tweet IDs, creating it if needed.
+    
+    The connection is opened once per process and reused.
+    """
+    global _seen_db
+    if _seen_db is None:
+        import sqlite3
+        
+        _seen_db = sqlite3.connect(str(SEEN_DB_FILE))
+        _seen_db.execute("PRAGMA journal_mode=WAL")
+        _seen_db.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "username TEXT NOT NULL, "
+            "tweet_id TEXT NOT NULL, "
+            "ts REAL NOT NULL, "
+            "PRIMARY KEY (username, tweet_id))"
+        )
+        _seen_db.execute("CREATE INDEX IF NOT EXISTS seen_recent ON seen (username, ts)")
+    return _seen_db
+
+
+def find_unseen_tweet_ids(username: str, tweet_ids: list) -> set:
+    """Return the tweet IDs not yet recorded as seen for an account."""
+    if not tweet_ids:
+        return set()
+    
+    placeholders = ", ".join("?" * len(tweet_ids))
+    rows = get_seen_db().execute(
+        f"SELECT tweet_id FROM seen WHERE username = ? AND tweet_id IN ({placeholders})",
+        [username, *tweet_ids]
+    )
+    return set(tweet_ids).difference(row[0] for row in rows)
+
+
+def record_seen_tweets(seen_by_account: dict) -> None:
+    """Record fetched tweet IDs (oldest first, per account) as seen, keeping SEEN_TWEETS_LIMIT each."""
+    db = get_seen_db()
+    now = time.time()
+    
+    with db:
+        for username, tweet_ids in seen_by_account.items():
+            if not tweet_ids:
+                continue
+            
+            # Refresh ts for every ID still in the feed so pruning evicts by last
+            # seen; the tiny per-position offset keeps newer IDs ranked higher
+            db.executemany(
+                "INSERT INTO seen (username, tweet_id, ts) VALUES (?, ?, ?) "
+                "ON CONFLICT(username, tweet_id) DO UPDATE SET ts = excluded.ts",
+                [(username, tweet_id, now + i * 1e-6) for i, tweet_id in enumerate(tweet_ids)]
+            )
+            db.execute(
+                "DELETE FROM seen WHERE username = ? AND rowid NOT IN ("
+                "SELECT rowid FROM seen WHERE username = ? "
+                "ORDER BY ts DESC, rowid DESC LIMIT ?)",
+                (username, username, SEEN_TWEETS_LIMIT)
+            )
 
 
 def load_state() -> dict:
-    """Load seen tweets state from file."""
+    """Load state from file, moving any seen tweet IDs it holds into the database."""
     if STATE_FILE.exists():
-        with open(STATE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"seen_tweets": {}, "last_check": {}}
+        orjson = load_orjson()
+        raw = STATE_FILE.read_bytes()
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if state.get("tweet_id_scheme") != TWEET_ID_SCHEME:
+            # Keep MD5-based IDs around until each account has been re-checked
+            state["legacy_seen_tweets"] = state.pop("seen_tweets", {})
+            state["tweet_id_scheme"] = TWEET_ID_SCHEME
+        
+        # Older versions kept seen IDs (oldest first) in this file; import them
+        # with ts=0 so they rank below anything recorded from now on
+        seen_tweets = state.pop("seen_tweets", None)
+        if seen_tweets:
+            db = get_seen_db()
+            with db:
+                db.executemany(
+                    "INSERT OR IGNORE INTO seen (username, tweet_id, ts) VALUES (?, ?, 0)",
+                    [(username, tweet_id) for username, ids in seen_tweets.items() for tweet_id in ids]
+                )
+        return state
+    return {"last_check": {}, "tweet_id_scheme": TWEET_ID_SCHEME}
 
 
 def save_state(state: dict) -> None:
-    """Save seen tweets state to file."""
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    """Save state to file (seen tweet IDs live in SEEN_DB_FILE)."""
+    data = dict(state)
+    if not data.get("legacy_seen_tweets"):
+        data.pop("legacy_seen_tweets", None)
+    # State is machine-only, so skip pretty-printing to keep it small and fast
+    orjson = load_orjson()
+    if orjson is not None:
+        raw = orjson.dumps(data)
+    else:
+        raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    write_file_atomic(STATE_FILE, raw)
+
+
+def save_check_results(state: dict, seen_by_account: dict) -> None:
+    """Persist a finished check after notifying: record seen tweet IDs, then save state."""
+    # IDs first: saving the HTTP validators alone would hide unrecorded tweets behind a 304
+    record_seen_tweets(seen_by_account)
+    save_state(state)
 
 
 def normalize_username(username: str) -> str:
@@ -94,228 +278,589 @@ def normalize_username(username: str) -> str:
 
 def get_tweet_id(link: str, title: str) -> str:
     """Generate a unique ID for a tweet based on its link and title."""
+    import hashlib
+    
+    content = f"{link}:{title}"
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+def get_legacy_tweet_id(link: str, title: str) -> str:
+    """Generate a tweet ID the way versions before TWEET_ID_SCHEME did."""
+    import hashlib
+    
     content = f"{link}:{title}"
     return hashlib.md5(content.encode()).hexdigest()[:16]
 
 
 def clean_html(text: str) -> str:
     """Remove HTML tags and decode HTML entities."""
-    # Remove HTML tags
-    clean = re.sub(r'<[^>]+>', '', text)
-    # Decode HTML entities
-    clean = unescape(clean)
-    # Clean up whitespace
-    clean = re.sub(r'\s+', ' ', clean).strip()
-    return clean
+    return WHITESPACE_RE.sub(' ', unescape(HTML_TAG_RE.sub('', text))).strip()
 
 
-def fetch_rss_feed(username: str, nitter_instance: str) -> Optional[str]:
-    """Fetch RSS feed for a Twitter user from a Nitter instance."""
-    # Nitter RSS feed URL format: https://instance/{username}/rss
-    url = f"{nitter_instance}/{username}/rss"
+def _fetch_rss_feed_sync(url: str, username: str, nitter_instance: str, validators: dict) -> tuple:
+    """Fetch RSS feed with blocking urllib (used when aiohttp is unavailable).
+    
+    Returns (body, instance_ok, response_headers) like _fetch_rss_feed_async.
+    """
+    import urllib.error
+    import urllib.request
     
     try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml, */*"
-            }
-        )
+        req = urllib.request.Request(url, headers={**REQUEST_HEADERS, **validators})
         with urllib.request.urlopen(req, timeout=30) as response:
-            return response.read().decode("utf-8")
+            return response.read(), True, response.headers
     except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return NOT_MODIFIED, True, e.headers
         print(f"HTTP Error fetching feed for @{username} from {nitter_instance}: {e.code} {e.reason}")
-        return None
+        return None, e.code == 404, None
     except urllib.error.URLError as e:
         print(f"URL Error fetching feed for @{username} from {nitter_instance}: {e.reason}")
-        return None
+        return None, False, None
     except Exception as e:
         print(f"Error fetching feed for @{username} from {nitter_instance}: {e}")
-        return None
+        return None, False, None
 
 
-def parse_rss_feed(xml_content: str) -> list:
-    """Parse RSS feed XML and return list of tweets."""
-    tweets = []
+async def _get_feed_text(session, url: str, username: str, nitter_instance: str, validators: dict) -> tuple:
+    """Perform a single GET on the shared session and return (body, instance_ok, response_headers)."""
+    import aiohttp
+    
+    async with session.get(url, headers=validators, timeout=aiohttp.ClientTimeout(total=30)) as response:
+        if response.status == 304:
+            return NOT_MODIFIED, True, response.headers
+        if response.status >= 400:
+            print(f"HTTP Error fetching feed for @{username} from {nitter_instance}: {response.status} {response.reason}")
+            return None, response.status == 404, None
+        return await response.read(), True, response.headers
+
+
+async def _fetch_rss_feed_async(session, url: str, username: str, nitter_instance: str, validators: dict) -> tuple:
+    """Fetch RSS feed over the shared aiohttp session.
+    
+    Returns (body, instance_ok, response_headers): body is None on failure
+    and NOT_MODIFIED on a 304, and instance_ok is False when the failure
+    points at the instance rather than the account (anything other than a
+    404).
+    """
+    import asyncio
+    import aiohttp
     
     try:
-        root = ET.fromstring(xml_content)
+        try:
+            return await _get_feed_text(session, url, username, nitter_instance, validators)
+        except aiohttp.ServerDisconnectedError:
+            # A pooled keep-alive socket went stale; the pool has dropped it,
+            # so retrying once opens a fresh connection.
+            return await _get_feed_text(session, url, username, nitter_instance, validators)
+    except aiohttp.ClientError as e:
+        print(f"URL Error fetching feed for @{username} from {nitter_instance}: {e}")
+        return None, False, None
+    except asyncio.TimeoutError:
+        print(f"Timeout fetching feed for @{username} from {nitter_instance}")
+        return None, False, None
+    except Exception as e:
+        print(f"Error fetching feed for @{username} from {nitter_instance}: {e}")
+        return None, False, None
+
+
+def instance_backoff(consecutive_failures: int) -> int:
+    """Return how many seconds to skip an instance after repeated failures."""
+    return min(INSTANCE_BACKOFF_BASE * 2 ** (consecutive_failures - 1), INSTANCE_BACKOFF_MAX)
+
+
+def is_instance_backing_off(health: dict, nitter_instance: str) -> bool:
+    """Check whether an instance failed recently enough to be skipped."""
+    entry = health.get(nitter_instance)
+    if not entry:
+        return False
+    return time.time() - entry["fail_ts"] < instance_backoff(entry["consecutive"])
+
+
+def record_instance_result(health: dict, nitter_instance: str, ok: bool, check_started: float) -> None:
+    """Reset an instance's failure count on success, or bump it once per run on failure."""
+    if ok:
+        health.pop(nitter_instance, None)
+        return
+    
+    entry = health.setdefault(nitter_instance, {"fail_ts": 0, "consecutive": 0})
+    # Concurrent accounts failing on the same instance count as one failed poll
+    if entry["fail_ts"] < check_started:
+        entry["consecutive"] += 1
+    entry["fail_ts"] = time.time()
+
+
+def get_cache_validators(http_cache: dict, username: str, nitter_instance: str) -> dict:
+    """Build conditional request headers from the last response for this feed."""
+    entry = http_cache.get(username)
+    if not entry or entry.get("instance") != nitter_instance:
+        return {}
+    
+    validators = {}
+    if entry.get("etag"):
+        validators["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        validators["If-Modified-Since"] = entry["last_modified"]
+    return validators
+
+
+def store_cache_validators(http_cache: dict, username: str, nitter_instance: str, headers) -> None:
+    """Remember the ETag/Last-Modified headers of a successful response."""
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag or last_modified:
+        http_cache[username] = {
+            "instance": nitter_instance,
+            "etag": etag,
+            "last_modified": last_modified
+        }
+    else:
+        http_cache.pop(username, None)
+
+
+async def fetch_rss_feed(
+    session,
+    username: str,
+    nitter_instance: str,
+    health: Optional[dict] = None,
+    http_cache: Optional[dict] = None,
+    check_started: Optional[float] = None
+):
+    """Fetch RSS feed for a Twitter user from a Nitter instance.
+    
+    Returns the feed as bytes, None on failure, or NOT_MODIFIED on a 304.
+    """
+    if check_started is None:
+        check_started = time.time()
+    
+    url = FEED_URL_TEMPLATE.format(instance=nitter_instance, username=username)
+    validators = {}
+    if http_cache is not None:
+        validators = get_cache_validators(http_cache, username, nitter_instance)
+    
+    if session is None:
+        import asyncio
         
-        # Handle different RSS formats
-        channel = root.find("channel")
-        if channel is None:
-            # Try Atom format
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
-            entries = root.findall("atom:entry", ns)
-            for entry in entries:
-                title = entry.find("atom:title", ns)
-                link = entry.find("atom:link", ns)
-                published = entry.find("atom:published", ns)
-                content = entry.find("atom:content", ns)
-                
-                tweet = {
-                    "title": clean_html(title.text) if title is not None and title.text else "",
-                    "link": link.get("href") if link is not None else "",
-                    "published": published.text if published is not None and published.text else "",
-                    "content": clean_html(content.text) if content is not None and content.text else ""
-                }
-                tweet["id"] = get_tweet_id(tweet["link"], tweet["title"])
-                tweets.append(tweet)
-        else:
-            # Standard RSS format
-            items = channel.findall("item")
-            for item in items:
-                title = item.find("title")
-                link = item.find("link")
-                pub_date = item.find("pubDate")
-                description = item.find("description")
-                
-                tweet = {
-                    "title": clean_html(title.text) if title is not None and title.text else "",
-                    "link": link.text if link is not None and link.text else "",
-                    "published": pub_date.text if pub_date is not None and pub_date.text else "",
-                    "content": clean_html(description.text) if description is not None and description.text else ""
-                }
-                tweet["id"] = get_tweet_id(tweet["link"], tweet["title"])
-                tweets.append(tweet)
+        loop = asyncio.get_running_loop()
+        body, instance_ok, headers = await loop.run_in_executor(
+            None, _fetch_rss_feed_sync, url, username, nitter_instance, validators
+        )
+    else:
+        body, instance_ok, headers = await _fetch_rss_feed_async(
+            session, url, username, nitter_instance, validators
+        )
+    
+    if health is not None:
+        record_instance_result(health, nitter_instance, instance_ok, check_started)
+    
+    if http_cache is not None and body is not None and body is not NOT_MODIFIED:
+        store_cache_validators(http_cache, username, nitter_instance, headers)
+    
+    return body
+
+
+def _parse_rss_item(item) -> dict:
+    """Extract tweet fields from an RSS <item> element."""
+    title = item.find("title")
+    link = item.find("link")
+    pub_date = item.find("pubDate")
+    description = item.find("description")
+    
+    return {
+        "title": clean_html(title.text) if title is not None and title.text else "",
+        "link": link.text if link is not None and link.text else "",
+        "published": pub_date.text if pub_date is not None and pub_date.text else "",
+        "content": clean_html(description.text) if description is not None and description.text else ""
+    }
+
+
+def _parse_atom_entry(entry) -> dict:
+    """Extract tweet fields from an Atom <entry> element."""
+    title = entry.find(ATOM_TITLE_TAG)
+    link = entry.find(ATOM_LINK_TAG)
+    published = entry.find(ATOM_PUBLISHED_TAG)
+    content = entry.find(ATOM_CONTENT_TAG)
+    
+    return {
+        "title": clean_html(title.text) if title is not None and title.text else "",
+        "link": link.get("href") if link is not None else "",
+        "published": published.text if published is not None and published.text else "",
+        "content": clean_html(content.text) if content is not None and content.text else ""
+    }
+
+
+class EntitiesForbiddenError(ValueError):
+    """Raised when a feed parsed with lxml declares its own XML entities."""
+
+
+def load_xml_parser() -> tuple:
+    """Return (iterparse, parse_errors) for untrusted feed XML: lxml, then defusedxml, then stdlib."""
+    try:
+        from lxml import etree
+    except ImportError:
+        pass
+    else:
+        def iterparse(source, events):
+            context = etree.iterparse(
+                source,
+                events=events,
+                resolve_entities=False,
+                no_network=True,
+                huge_tree=False
+            )
+            checked = False
+            for event, elem in context:
+                if not checked:
+                    # Reject entity declarations like defusedxml, since leaving them
+                    # unexpanded would truncate text; the DTD is parsed by now
+                    dtd = elem.getroottree().docinfo.internalDTD
+                    if dtd is not None and any(True for _ in dtd.iterentities()):
+                        raise EntitiesForbiddenError("feed declares XML entities")
+                    checked = True
+                yield event, elem
+        return iterparse, (etree.ParseError, EntitiesForbiddenError)
+    
+    try:
+        from defusedxml import DefusedXmlException
+        from defusedxml.ElementTree import ParseError, iterparse
+    except ImportError:
+        # Fall back to the pure-Python tree builder
+        import xml.etree.ElementTree as ET
+        return ET.iterparse, (ET.ParseError,)
+    return iterparse, (ParseError, DefusedXmlException)
+
+
+def parse_rss_feed(xml_content: bytes) -> list:
+    """Parse RSS or Atom feed XML and return list of tweets."""
+    import io
+    
+    iterparse, parse_errors = load_xml_parser()
+    tweets = []
+    
+    try:
+        # Stream the document and handle each item as soon as it closes,
+        # so the whole feed never has to be built up in memory. Start events
+        # track the open ancestors so processed items can be detached.
+        parents = []
+        for event, elem in iterparse(io.BytesIO(xml_content), events=("start", "end")):
+            if event == "start":
+                if not parents:
+                    # The root element tells RSS and Atom apart up front
+                    if elem.tag == ATOM_FEED_TAG:
+                        item_tag, parse_item = ATOM_ENTRY_TAG, _parse_atom_entry
+                    else:
+                        item_tag, parse_item = "item", _parse_rss_item
+                parents.append(elem)
+                continue
+            
+            parents.pop()
+            if elem.tag != item_tag:
+                continue
+            
+            tweet = parse_item(elem)
+            tweet["id"] = get_tweet_id(tweet["link"], tweet["title"])
+            tweets.append(tweet)
+            
+            # Drop the item from the tree so at most one is held at a time
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
                 
-    except ET.ParseError as e:
+    except parse_errors as e:
         print(f"Error parsing RSS feed: {e}")
         return []
     
     return tweets
 
 
-def send_notification(title: str, message: str, url: str = "", sound: str = "default") -> bool:
-    """Send a macOS notification using osascript."""
-    # Escape special characters for AppleScript
-    title = title.replace('"', '\\"').replace("'", "\\'")
-    message = message.replace('"', '\\"').replace("'", "\\'")
-    
+# Shows each (title, message, sound) triple passed on the command line.
+# Taking the text from argv means tweet content never has to be escaped
+# into the script source.
+NOTIFICATION_SCRIPT = """on run argv
+    repeat with i from 1 to (count of argv) by 3
+        set theTitle to item i of argv
+        set theMessage to item (i + 1) of argv
+        set theSound to item (i + 2) of argv
+        if theSound is "" then
+            display notification theMessage with title theTitle
+        else
+            display notification theMessage with title theTitle sound name theSound
+        end if
+    end repeat
+end run"""
+
+
+def _notification_args(title: str, message: str, sound: str = "default") -> list:
+    """Build the osascript arguments for one notification."""
     # Truncate message if too long
     if len(message) > 200:
         message = message[:197] + "..."
     
-    # Build AppleScript command
-    script = f'display notification "{message}" with title "{title}"'
-    if sound and sound != "none":
-        script += f' sound name "{sound}"'
+    if not sound or sound == "none":
+        sound = ""
+    
+    return [title, message, sound]
+
+
+def _run_notification_script(args: list) -> Optional[str]:
+    """Run NOTIFICATION_SCRIPT with the given argv.
+    
+    Returns None on success or a short error; raises FileNotFoundError without osascript.
+    """
+    import subprocess
     
     try:
         subprocess.run(
-            ["osascript", "-e", script],
+            ["osascript", "-e", NOTIFICATION_SCRIPT, *args],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=10
         )
-        return True
     except subprocess.CalledProcessError as e:
-        print(f"Error sending notification: {e}")
-        return False
+        return f"osascript exited with status {e.returncode}"
+    except subprocess.TimeoutExpired:
+        return "osascript timed out"
+    return None
+
+
+def send_notifications(notifications: list) -> bool:
+    """Send (title, message, sound) notifications in one osascript call, retrying per item on failure.
+    
+    Returns False only if none could be sent.
+    """
+    if not notifications:
+        return True
+    
+    built = [_notification_args(*notification) for notification in notifications]
+    
+    try:
+        error = _run_notification_script([arg for args in built for arg in args])
     except FileNotFoundError:
         # osascript not available (not on macOS)
-        print(f"[Notification] {title}: {message}")
+        for title, message, _ in built:
+            print(f"[Notification] {title}: {message}")
         return True
-    except Exception as e:
-        print(f"Error sending notification: {e}")
+    
+    if error is None:
+        return True
+    if len(built) == 1:
+        print(f"Error sending notification: {error}")
         return False
+    
+    print(f"Error sending notifications, retrying one by one: {error}")
+    delivered = False
+    for args in built:
+        error = _run_notification_script(args)
+        if error is None:
+            delivered = True
+        else:
+            print(f"Error sending notification to {args[0]}: {error}")
+    return delivered
 
 
-def check_account(username: str, config: dict, state: dict) -> list:
-    """Check a single account for new tweets and return new tweets."""
+def is_recently_checked(username: str, config: dict, state: dict, now: float) -> bool:
+    """Check whether an account's last check started within the configured interval.
+    
+    last_check holds epoch seconds; ISO strings written by older versions
+    and timestamps in the future (clock changes) never count as recent.
+    """
+    last_check = state.get("last_check", {}).get(username)
+    if not isinstance(last_check, (int, float)):
+        return False
+    
+    elapsed = now - last_check
+    interval = config.get("check_interval_minutes", 5) * 60
+    return 0 <= elapsed < interval - CHECK_INTERVAL_MARGIN
+
+
+async def check_account(
+    username: str,
+    config: dict,
+    state: dict,
+    session=None,
+    semaphore=None,
+    force: bool = False
+) -> tuple:
+    """Check a single account for new tweets, skipping recent checks unless forced.
+    
+    Returns (new_tweets, fetched_ids) with every fetched tweet ID, oldest first.
+    """
+    import asyncio
+    
     username = normalize_username(username)
-    new_tweets = []
+    # Recorded as last_check on success, so the next interval counts from
+    # when this check started rather than when a slow fetch finished
+    started = time.time()
+    
+    if not force and is_recently_checked(username, config, state, started):
+        print(f"Skipping @{username}, checked less than {config.get('check_interval_minutes', 5)} minutes ago")
+        return [], []
     
-    # Try each Nitter instance until one works
-    nitter_instance = config.get("nitter_instance", NITTER_INSTANCES[0])
-    instances_to_try = [nitter_instance] + [i for i in NITTER_INSTANCES if i != nitter_instance]
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(config.get("max_concurrency", 5))
     
     xml_content = None
-    for instance in instances_to_try:
-        xml_content = fetch_rss_feed(username, instance)
-        if xml_content:
-            break
+    async with semaphore:
+        # Try each Nitter instance until one works, skipping recently failing ones
+        health = state.setdefault("instance_health", {})
+        nitter_instance = config.get("nitter_instance", NITTER_INSTANCES[0])
+        instances_to_try = [
+            instance
+            for instance in [nitter_instance] + [i for i in NITTER_INSTANCES if i != nitter_instance]
+            if not is_instance_backing_off(health, instance)
+        ]
+        if not instances_to_try:
+            # Everything is backing off; probe the preferred instance anyway
+            instances_to_try = [nitter_instance]
+        
+        for instance in instances_to_try:
+            xml_content = await fetch_rss_feed(
+                session,
+                username,
+                instance,
+                health,
+                state.setdefault("http_cache", {}),
+                started
+            )
+            if xml_content:
+                break
     
     if not xml_content:
-        print(f"Failed to fetch feed for @{username} from all Nitter instances")
-        return []
+        print(f"Failed to fetch feed for @{username} from {len(instances_to_try)} Nitter instance(s)")
+        return [], []
     
-    tweets = parse_rss_feed(xml_content)
+    if xml_content is NOT_MODIFIED:
+        # Feed unchanged since the last fetch, so there is nothing to parse
+        state.setdefault("last_check", {})[username] = started
+        return [], []
+    
+    # Parse on the worker pool so feeds for different accounts parse in parallel
+    # (lxml releases the GIL); state is only touched back on the event loop
+    loop = asyncio.get_running_loop()
+    tweets = await loop.run_in_executor(None, parse_rss_feed, xml_content)
     
     if not tweets:
         print(f"No tweets found for @{username}")
-        return []
-    
-    # Get seen tweets for this user
-    seen_ids = set(state.get("seen_tweets", {}).get(username, []))
+        return [], []
     
-    # Find new tweets
+    # Feeds list newest first; keep IDs oldest first so pruning drops the oldest
+    tweet_ids = list(dict.fromkeys(tweet["id"] for tweet in reversed(tweets)))
+    unseen_ids = find_unseen_tweet_ids(username, tweet_ids)
+    unseen = []
     for tweet in tweets:
-        if tweet["id"] not in seen_ids:
-            new_tweets.append(tweet)
-            seen_ids.add(tweet["id"])
+        if tweet["id"] in unseen_ids:
+            unseen.append(tweet)
+            unseen_ids.discard(tweet["id"])
     
-    # Update state
-    if "seen_tweets" not in state:
-        state["seen_tweets"] = {}
-    state["seen_tweets"][username] = list(seen_ids)[-100:]  # Keep last 100 tweet IDs
+    # Tweets already seen under the legacy ID scheme are recorded but not reported
+    legacy_ids = set(state.get("legacy_seen_tweets", {}).pop(username, []))
+    if legacy_ids:
+        new_tweets = [
+            tweet for tweet in unseen
+            if get_legacy_tweet_id(tweet["link"], tweet["title"]) not in legacy_ids
+        ]
+    else:
+        new_tweets = unseen
     
     if "last_check" not in state:
         state["last_check"] = {}
-    state["last_check"][username] = datetime.now().isoformat()
+    state["last_check"][username] = started
     
-    return new_tweets
+    return new_tweets, tweet_ids
 
 
-def check_all_accounts(config: dict, state: dict) -> dict:
-    """Check all configured accounts for new tweets."""
-    results = {}
+def create_session():
+    """Create a shared HTTP session, or None when aiohttp is unavailable."""
+    try:
+        import aiohttp
+    except ImportError:
+        # Fall back to urllib in a thread pool when aiohttp is not installed
+        return None
+    
+    # Keep sockets alive between accounts and cap connections per Nitter host
+    connector = aiohttp.TCPConnector(limit=20, limit_per_host=5, keepalive_timeout=60)
+    return aiohttp.ClientSession(connector=connector, headers=REQUEST_HEADERS)
+
+
+async def check_accounts(usernames: list, config: dict, state: dict, force: bool = False) -> tuple:
+    """Check several accounts concurrently.
+    
+    Returns (results, seen_by_account): new tweets and fetched tweet IDs per account.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Blocking urllib fetches and feed parsing run on a bounded thread pool
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKER_THREADS, len(usernames))))
+    )
+    
+    session = create_session()
+    semaphore = asyncio.Semaphore(config.get("max_concurrency", 5))
+    try:
+        results = await asyncio.gather(
+            *(check_account(username, config, state, session, semaphore, force) for username in usernames)
+        )
+    finally:
+        if session is not None:
+            await session.close()
+    
+    return (
+        {username: new_tweets for username, (new_tweets, _) in zip(usernames, results)},
+        {username: fetched_ids for username, (_, fetched_ids) in zip(usernames, results)}
+    )
+
+
+async def check_all_accounts(config: dict, state: dict, force: bool = False) -> tuple:
+    """Check all configured accounts for new tweets and send notifications.
+    
+    Returns (results, seen_by_account, notified); notified is False if nothing was delivered.
+    """
     accounts = config.get("accounts", [])
     
     if not accounts:
         print("No accounts configured. Use --add @username to add accounts.")
-        return results
+        return {}, {}, True
     
     for username in accounts:
-        username = normalize_username(username)
         print(f"Checking @{username}...")
-        new_tweets = check_account(username, config, state)
-        results[username] = new_tweets
-        
-        # Send notifications for new tweets
-        max_notifications = config.get("max_notifications_per_check", 5)
-        sound = config.get("notification_sound", "default")
-        
-        for i, tweet in enumerate(new_tweets[:max_notifications]):
+    
+    results, seen_by_account = await check_accounts(accounts, config, state, force)
+    
+    # Collect notifications for new tweets and send them in one batch
+    max_notifications = config.get("max_notifications_per_check", 5)
+    sound = config.get("notification_sound", "default")
+    notifications = []
+    
+    for username, new_tweets in results.items():
+        for tweet in new_tweets[:max_notifications]:
             title = f"@{username} posted"
             message = tweet.get("title") or tweet.get("content", "New tweet")
-            send_notification(title, message, tweet.get("link", ""), sound)
-            time.sleep(0.5)  # Small delay between notifications
+            notifications.append((title, message, sound))
         
         if len(new_tweets) > max_notifications:
             remaining = len(new_tweets) - max_notifications
-            send_notification(
+            notifications.append((
                 f"@{username}",
                 f"And {remaining} more new tweets...",
-                "",
                 sound
-            )
+            ))
+    
+    notified = send_notifications(notifications)
     
-    return results
+    return results, seen_by_account, notified
 
 
 def add_account(username: str, config: dict) -> bool:
     """Add an account to the monitoring list."""
     username = normalize_username(username)
     
-    if username in [normalize_username(a) for a in config.get("accounts", [])]:
+    if username in config["accounts"]:
         print(f"Account @{username} is already being monitored.")
         return False
     
-    if "accounts" not in config:
-        config["accounts"] = []
-    
     config["accounts"].append(username)
     save_config(config)
     print(f"Added @{username} to monitoring list.")
@@ -326,20 +871,12 @@ def remove_account(username: str, config: dict) -> bool:
     """Remove an account from the monitoring list."""
     username = normalize_username(username)
     
-    accounts = config.get("accounts", [])
-    normalized_accounts = [normalize_username(a) for a in accounts]
-    
-    if username not in normalized_accounts:
+    try:
+        config["accounts"].remove(username)
+    except ValueError:
         print(f"Account @{username} is not in the monitoring list.")
         return False
     
-    # Find and remove the account
-    for i, acc in enumerate(accounts):
-        if normalize_username(acc) == username:
-            accounts.pop(i)
-            break
-    
-    config["accounts"] = accounts
     save_config(config)
     print(f"Removed @{username} from monitoring list.")
     return True
@@ -398,6 +935,11 @@ def main():
         metavar="URL",
         help="Set the Nitter instance URL (e.g., https://nitter.poast.org)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Check accounts even if they were checked within the check interval"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -406,9 +948,8 @@ def main():
     
     args = parser.parse_args()
     
-    # Load configuration and state
+    # Load configuration
     config = load_config()
-    state = load_state()
     
     # Handle commands
     if args.add:
@@ -435,11 +976,19 @@ def main():
         print(f"Nitter instance set to {args.set_nitter}")
         return
     
+    # Only the check commands need the state file and the async machinery
+    import asyncio
+    
+    state = load_state()
+    
     if args.check:
         username = normalize_username(args.check)
         print(f"Checking @{username}...")
-        new_tweets = check_account(username, config, state)
-        save_state(state)
+        # An explicit single-account check always fetches
+        results, seen_by_account = asyncio.run(
+            check_accounts([username], config, state, force=True)
+        )
+        new_tweets = results[username]
         
         if new_tweets:
             print(f"Found {len(new_tweets)} new tweet(s):")
@@ -449,14 +998,22 @@ def main():
                     print(f"    {tweet['link']}")
         else:
             print("No new tweets.")
+        
+        save_check_results(state, seen_by_account)
         return
     
     # Default: check all accounts
     if not args.quiet:
         print(f"X Monitor - Checking {len(config.get('accounts', []))} account(s)...")
     
-    results = check_all_accounts(config, state)
-    save_state(state)
+    results, seen_by_account, notified = asyncio.run(
+        check_all_accounts(config, state, args.force)
+    )
+    if notified:
+        save_check_results(state, seen_by_account)
+    else:
+        # Leave state and seen IDs untouched so these tweets are retried
+        print("Could not send notifications; new tweets will be retried on the next check.")
     
     # Summary
     total_new = sum(len(tweets) for tweets in results.values())